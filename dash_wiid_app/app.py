@@ -1,13 +1,24 @@
+import atexit
 import os
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Dash, dcc, html, Input, Output, State, dash_table, no_update
+import plotly.io as pio
+from dash import (Dash, dcc, html, Input, Output, State, dash_table,
+                  no_update, callback_context)
 import dash_bootstrap_components as dbc
 
+# orjson handles the numpy customdata arrays natively and is several times
+# faster than stdlib json for figure serialization
+pio.json.config.default_engine = "orjson"
+
 # ------------------------------------------------------------------------------------
 # Paths & configuration
 # ------------------------------------------------------------------------------------
@@ -22,6 +33,8 @@ DATA_DIR = Path(os.environ.get("DATA_DIR", "/tmp/submissions"))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 SUBS_PATH = DATA_DIR / "student_submissions.csv"
+# Typed, compressed store for restarts; the CSV remains the seed/export format
+SUBS_PARQUET = DATA_DIR / "student_submissions.parquet"
 READ_ONLY = os.getenv("APP_READONLY", "0") == "1"
 
 print(f"[BOOT] WIID_PATH={WIID_PATH}  DATA_DIR={DATA_DIR} "
@@ -46,10 +59,13 @@ EXPECTED_COLS = [
 ]
 
 def load_wiid_latest(path: Path) -> pd.DataFrame:
+    # Arrow parser: multithreaded C++ reader, no Python row-wise work
+    kwargs = dict(engine="pyarrow", dtype_backend="pyarrow",
+                  dtype={"c3": "string[pyarrow]"})
     # Try comma; fallback to semicolon
-    df = pd.read_csv(path)
+    df = pd.read_csv(path, **kwargs)
     if df.shape[1] == 1:
-        df = pd.read_csv(path, sep=";")
+        df = pd.read_csv(path, sep=";", **kwargs)
     # Normalize headers
     df.columns = [c.strip().lower() for c in df.columns]
     # Check required columns
@@ -59,15 +75,66 @@ def load_wiid_latest(path: Path) -> pd.DataFrame:
             f"WIID CSV missing required columns: {missing}. "
             f"Expected: {', '.join(EXPECTED_COLS)}"
         )
-    # Coerce types
-    df["c3"] = df["c3"].astype(str).str.upper()
-    df["year"] = pd.to_numeric(df["year"], errors="coerce").astype("Int64")
-    df["gini"] = pd.to_numeric(df["gini"], errors="coerce")
+    # Arrow already typed year/gini; just normalize the ISO codes
+    df["c3"] = df["c3"].str.upper()
     # Filter usable rows
     df = df.dropna(subset=["c3", "year", "gini"])
-    return df[EXPECTED_COLS]
+    df = df[EXPECTED_COLS]
+    # Shrink the in-memory frame and the customdata shipped with the figure:
+    # year/gini fit in 2/4 bytes and the descriptive columns repeat a handful
+    # of values
+    df["year"] = df["year"].astype("int16")
+    df["gini"] = df["gini"].astype("float32")
+    for c in ["resource", "scale_detailed", "incomegroup", "region_wb"]:
+        df[c] = df[c].astype("category")
+    return df
+
+# Indexed by c3 (kept as a column too) so any row access is a hash lookup
+latest = load_wiid_latest(WIID_PATH).set_index("c3", drop=False)
+
+# c3 is unique per row, so index once for O(1) click lookups instead of a
+# boolean scan over the frame per click
+LATEST_BY_ISO3 = latest.to_dict("index")
+
+# Color range of the base map, fixed for the life of the process
+GINI_MIN = float(latest["gini"].min())
+GINI_MAX = float(latest["gini"].max())
+
+# Base choropleth: `latest` is immutable after boot, so build the figure once
+# here instead of on every callback. Callbacks copy it and only add overlays.
+def build_base_fig() -> go.Figure:
+    # Plain go.Choropleth skips plotly.express's per-call preprocessing
+    # (tidy checks, hover templating, config inference); the static
+    # hovertemplate reproduces the old px hover card
+    trace = go.Choropleth(
+        locations=latest["c3"].to_numpy(),
+        z=latest["gini"].to_numpy(),
+        locationmode="ISO-3",
+        customdata=latest[["country", "year", "resource", "scale_detailed",
+                           "incomegroup", "region_wb"]].to_numpy(),
+        colorscale=px.colors.sequential.Plasma,
+        zmin=GINI_MIN,
+        zmax=GINI_MAX,
+        colorbar=dict(title="Gini"),
+        hovertemplate=(
+            "<b>%{customdata[0]}</b><br><br>"
+            "Gini (0–100)=%{z:.2f}<br>"
+            "year=%{customdata[1]}<br>"
+            "resource=%{customdata[2]}<br>"
+            "scale_detailed=%{customdata[3]}<br>"
+            "incomegroup=%{customdata[4]}<br>"
+            "region_wb=%{customdata[5]}<extra></extra>"
+        ),
+    )
+    fig = go.Figure(trace)
+    fig.update_layout(title="Latest Available Gini by Country (WIID curated)")
+    return fig
 
-latest = load_wiid_latest(WIID_PATH)
+BASE_FIG = build_base_fig()
+
+# Pre-validated dict form: serving this from the layout skips Plotly's
+# per-property validators on every page load
+BASE_FIG_JSON = BASE_FIG.to_plotly_json()
 
 # ------------------------------------------------------------------------------------
 # Submissions load/save
@@ -77,25 +144,179 @@ SUB_COLS = [
     "summary_md", "evidence_links", "rating", "status"
 ]
 
-def load_subs() -> pd.DataFrame:
-    if not SUBS_PATH.exists():
-        return pd.DataFrame(columns=SUB_COLS)
-    df = pd.read_csv(SUBS_PATH)
+# The in-memory frame is the source of truth: callbacks read and mutate it
+# under a lock and a daemon thread flushes dirty state to disk, keeping file
+# I/O off the request path entirely. `rev` bumps on every mutation so cached
+# derived views and the interval callbacks know when anything changed.
+FLUSH_SECS = 5
+
+def _normalize_subs(df: pd.DataFrame) -> pd.DataFrame:
     for c in SUB_COLS:
         if c not in df.columns:
             df[c] = ""
     df = df[SUB_COLS]
+    # Uniform string dtype (ratings may arrive as ints from the admin
+    # table); Parquet needs consistent column types
+    for c in SUB_COLS:
+        if c != "timestamp":
+            df[c] = df[c].astype("string")
     df["status"] = df["status"].fillna("").str.lower()
+    # Normalize case in the frame itself (legacy rows may predate the
+    # uppercase-at-submit invariant) so readers never re-run .str passes
+    df["country_iso3"] = df["country_iso3"].fillna("").str.upper()
+    # ISO8601 fast path covers both the submit format and admin-edited values
+    df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601",
+                                     errors="coerce", utc=True)
+    # Newest-first once here (stable sort); consumers just .head()/.iloc[0]
+    return df.sort_values("timestamp", ascending=False, kind="mergesort")
+
+# Everything is read as strings: rating/timestamp normalization happens in
+# pandas, and empty cells must stay representable
+_SUBS_SCHEMA = {c: pa.string() for c in SUB_COLS}
+
+def _read_subs_csv() -> pd.DataFrame:
+    if not SUBS_PATH.exists():
+        return _normalize_subs(pd.DataFrame(columns=SUB_COLS))
+    # Arrow's C++ reader skips pandas' Python-level parse layer entirely
+    tbl = pacsv.read_csv(
+        SUBS_PATH,
+        convert_options=pacsv.ConvertOptions(column_types=_SUBS_SCHEMA))
+    return _normalize_subs(tbl.to_pandas(types_mapper=pd.ArrowDtype))
+
+def _read_subs() -> pd.DataFrame:
+    # Prefer the Parquet store; fall back to the (seeded) legacy CSV. A
+    # corrupt file must not take the whole app down with it — start empty
+    # and leave the bad file on disk for inspection.
+    try:
+        if SUBS_PARQUET.exists():
+            return _normalize_subs(pd.read_parquet(SUBS_PARQUET,
+                                                   engine="pyarrow"))
+        return _read_subs_csv()
+    except Exception as e:
+        print(f"[BOOT] Could not read submissions ({e}); starting empty")
+        return _normalize_subs(pd.DataFrame(columns=SUB_COLS))
+
+_SUBS_LOCK = threading.Lock()
+_SUBS_STATE = {"df": _read_subs(), "rev": 0, "dirty": False}
+
+# Derived views (unique ISO-3 codes, per-country groups), rebuilt only when
+# the revision moves so callbacks never rescan the frame. The rebuild lock
+# coalesces concurrent callbacks after a revision bump into one grouping
+# pass instead of N identical ones.
+_SUBS_CACHE = {"rev": -1, "df": None, "iso3s": (), "by_iso": {}}
+_SUBS_CACHE_LOCK = threading.Lock()
+
+def subs_rev() -> int:
+    return _SUBS_STATE["rev"]
+
+def load_subs() -> pd.DataFrame:
+    with _SUBS_LOCK:
+        df, rev = _SUBS_STATE["df"], _SUBS_STATE["rev"]
+    if rev != _SUBS_CACHE["rev"]:
+        with _SUBS_CACHE_LOCK:
+            if rev != _SUBS_CACHE["rev"]:
+                # country_iso3 is normalized at write time; a set over the
+                # raw ndarray beats the pandas unique machinery here
+                iso_arr = df["country_iso3"].to_numpy()
+                _SUBS_CACHE.update(
+                    rev=rev, df=df,
+                    iso3s=tuple({x for x in iso_arr if x}),
+                    by_iso={iso: g for iso, g
+                            in df.groupby("country_iso3") if iso},
+                )
     return df
 
+def subs_iso3s() -> tuple:
+    """Unique submitted ISO-3 codes (uppercased), from the cache."""
+    load_subs()
+    return _SUBS_CACHE["iso3s"]
+
+def subs_for_iso(iso3: str) -> pd.DataFrame:
+    """Submissions for one country, from the cached per-country groups."""
+    df = load_subs()
+    sub = _SUBS_CACHE["by_iso"].get(iso3)
+    # Empty slice of the real frame so the fallback keeps the proper
+    # dtypes (a bare DataFrame(columns=...) would make timestamp object
+    # and break .dt downstream)
+    return sub if sub is not None else df.iloc[:0]
+
+def _write_subs_parquet(df: pd.DataFrame):
+    SUBS_PARQUET.parent.mkdir(parents=True, exist_ok=True)
+    # Write-then-rename so readers never see a half-written file
+    tmp = SUBS_PARQUET.with_suffix(".parquet.tmp")
+    with open(tmp, "wb") as f:
+        df.to_parquet(f, engine="pyarrow", compression="zstd", index=False)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, SUBS_PARQUET)
+
+# Writers (flusher thread, atexit hook) share one tmp path, so the
+# write-fsync-replace sequence must never interleave
+_FLUSH_IO_LOCK = threading.Lock()
+_LAST_FLUSHED = {"rev": -1}
+
+def flush_subs():
+    """Persist the in-memory frame if it has unsaved changes."""
+    with _SUBS_LOCK:
+        if not _SUBS_STATE["dirty"]:
+            return
+        df = _SUBS_STATE["df"]
+        rev = _SUBS_STATE["rev"]
+        _SUBS_STATE["dirty"] = False
+    try:
+        with _FLUSH_IO_LOCK:
+            # A later revision may already be on disk if writers queued
+            # out of order; never replace it with this older snapshot
+            if rev <= _LAST_FLUSHED["rev"]:
+                return
+            _write_subs_parquet(df)
+            _LAST_FLUSHED["rev"] = rev
+    except Exception as e:
+        print(f"[FLUSH] Error writing submissions: {e}")
+        with _SUBS_LOCK:
+            _SUBS_STATE["dirty"] = True
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_SECS)
+        flush_subs()
+
+if not READ_ONLY:
+    threading.Thread(target=_flush_loop, daemon=True,
+                     name="subs-flush").start()
+    atexit.register(flush_subs)
+
 def save_subs(df: pd.DataFrame):
+    """Replace the submissions wholesale (admin save)."""
     if READ_ONLY:
         return False, "Read-only mode: saving disabled."
     try:
-        df = df.reindex(columns=SUB_COLS)
-        SUBS_PATH.parent.mkdir(parents=True, exist_ok=True)
-        df.to_csv(SUBS_PATH, index=False)
-        return True, f"Saved to {SUBS_PATH}"
+        df = _normalize_subs(df.reindex(columns=SUB_COLS))
+        with _SUBS_LOCK:
+            _SUBS_STATE.update(df=df, rev=_SUBS_STATE["rev"] + 1, dirty=True)
+        return True, f"Saved; flushing to {SUBS_PARQUET}"
+    except Exception as e:
+        return False, f"Error saving: {e}"
+
+def append_sub(entry: dict):
+    """Append one submission in memory; the flusher persists it."""
+    if READ_ONLY:
+        return False, "Read-only mode: saving disabled."
+    try:
+        row = pd.DataFrame([entry])
+        row["timestamp"] = pd.to_datetime(row["timestamp"], format="ISO8601",
+                                          errors="coerce", utc=True)
+        with _SUBS_LOCK:
+            prior = _SUBS_STATE["df"]
+            # Match the frame's dtypes exactly so concat never silently
+            # upcasts columns to object
+            row = row.astype(prior.dtypes.to_dict())
+            # Stable row labels: served pages reference rows by label, so
+            # appends must not renumber existing rows
+            row.index = [prior.index.max() + 1 if len(prior) else 0]
+            df = pd.concat([row, prior])
+            _SUBS_STATE.update(df=df, rev=_SUBS_STATE["rev"] + 1, dirty=True)
+        return True, f"Saved; flushing to {SUBS_PARQUET}"
     except Exception as e:
         return False, f"Error saving: {e}"
 
@@ -108,11 +329,14 @@ app = Dash(
 )
 server = app.server
 
-# Map panel
-map_panel = dbc.Col(
-    dcc.Graph(id="map", config={"responsive": True}, style={"height": "100vh"}),
-    md=8
-)
+# Map panel: the figure ships once with the layout; callbacks only push the
+# tiny submitted-ISO list and a clientside function restyles the borders
+map_panel = dbc.Col([
+    dcc.Graph(id="map", figure=BASE_FIG_JSON, config={"responsive": True},
+              style={"height": "100vh"}),
+    dcc.Store(id="overlay-store"),
+    dcc.Store(id="overlay-rev"),
+], md=8)
 
 # Right-side panel
 right_panel = dbc.Col([
@@ -127,17 +351,21 @@ right_panel = dbc.Col([
         columns=[{"name": c, "id": c} for c in
                  ["timestamp", "student_id", "title", "rating", "status"]],
         page_size=6,
+        page_action="custom",
+        page_current=0,
         style_cell={"whiteSpace": "normal", "height": "auto", "textAlign": "left"},
         style_table={"overflowX": "auto"},
     ),
-    dcc.Interval(id="interval-refresh", interval=20000, n_intervals=0)
+    dcc.Store(id="selected-iso3"),
+    dcc.Interval(id="interval-refresh", interval=120000, n_intervals=0)
 ], id="right-panel", md=4, style={"height": "100vh", "overflowY": "auto"})
 
 # Admin tab
 admin_help = dcc.Markdown("""
-**Admin mode** (TA/Instructor):  
-- Edit statuses (`approved`, `pending`, `rejected`) directly.  
-- Click **Save** to write back to `student_submissions.csv`.
+**Admin mode** (TA/Instructor):
+- Edit statuses (`approved`, `pending`, `rejected`) directly.
+- Click **Save** to apply changes; they persist to `student_submissions.parquet`
+  within a few seconds. Use the download button below for a CSV export.
 """)
 
 admin_controls = dbc.Row([
@@ -156,6 +384,8 @@ admin_table = dash_table.DataTable(
     id="admin-table",
     columns=[{"name": c, "id": c, "editable": True} for c in SUB_COLS],
     page_size=10,
+    page_action="custom",
+    page_current=0,
     editable=True,
     style_cell={"whiteSpace": "pre-wrap", "height": "auto", "textAlign": "left"},
     style_table={"overflowX": "auto"}
@@ -165,7 +395,8 @@ admin_tab = dbc.Container([
     admin_help,
     admin_controls,
     admin_table,
-    dcc.Interval(id="interval-admin-refresh", interval=30000, n_intervals=0),
+    dcc.Store(id="admin-rev"),
+    dcc.Interval(id="interval-admin-refresh", interval=120000, n_intervals=0),
 
     html.Hr(),
     html.Div([
@@ -239,6 +470,12 @@ def country_facts_card(row):
         html.H5("Country Facts"), html.Ul(items)
     ]))
 
+# latest is immutable, so render every facts card once at boot; clicks then
+# reuse the prebuilt component tree. The no-selection card is prebuilt too.
+FACTS_CACHE = {iso3: country_facts_card(row)
+               for iso3, row in LATEST_BY_ISO3.items()}
+FACTS_PLACEHOLDER = country_facts_card(None)
+
 def featured_md_block(note):
     if note is None:
         return dcc.Markdown("_No approved student note yet for this country._")
@@ -252,96 +489,171 @@ def featured_md_block(note):
 """
     return dcc.Markdown(md)
 
+NO_NOTE_PLACEHOLDER = featured_md_block(None)
+
 # ------------------------------------------------------------------------------------
 # Callbacks
 # ------------------------------------------------------------------------------------
 @app.callback(
+    Output("overlay-store", "data"),
+    Output("overlay-rev", "data"),
+    Input("interval-refresh", "n_intervals"),
+    State("overlay-rev", "data")
+)
+def update_overlay(n_intervals, client_rev):
+    # Only the submitted-ISO list crosses the wire (<1 KB); interval ticks
+    # short-circuit when this client already holds the current revision.
+    # The revision rides in a per-client store, so every browser catches
+    # up on its own next tick after a change
+    rev = subs_rev()
+    if n_intervals and client_rev == rev:
+        return no_update, no_update
+    return list(subs_iso3s()), rev
+
+
+# Restyle the base trace's borders in the browser: submitted countries get a
+# wide cyan outline. Mirrors the server-side styling previously applied to
+# BASE_FIG copies, without retransmitting the figure.
+app.clientside_callback(
+    """
+    function(isoList, fig) {
+        if (!fig || !fig.data || !fig.data.length) {
+            return window.dash_clientside.no_update;
+        }
+        // An empty list still restyles: every border drops back to the
+        // default, clearing highlights when submissions disappear
+        const submitted = new Set(isoList || []);
+        const locs = fig.data[0].locations;
+        const widths = new Array(locs.length);
+        const colors = new Array(locs.length);
+        for (let i = 0; i < locs.length; i++) {
+            const hit = submitted.has(locs[i]);
+            widths[i] = hit ? 2.5 : 0.5;
+            colors[i] = hit ? "#10e0e0" : "#444";
+        }
+        const trace = Object.assign({}, fig.data[0]);
+        trace.marker = Object.assign({}, trace.marker,
+                                     {line: {width: widths, color: colors}});
+        return Object.assign({}, fig,
+                             {data: [trace].concat(fig.data.slice(1))});
+    }
+    """,
     Output("map", "figure"),
-    Output("country-facts", "children"),
-    Output("student-note", "children"),
-    Output("sub-table", "data"),
-    Input("map", "clickData"),
-    Input("interval-refresh", "n_intervals")
+    Input("overlay-store", "data"),
+    State("map", "figure"),
 )
-def update_panel(clickData, _):
-    subs = load_subs()
 
-    base_fig = px.choropleth(
-        latest,
-        locations="c3",
-        color="gini",
-        hover_name="country",
-        hover_data={
-            "c3": False, "gini": ":.2f", "year": True,
-            "resource": True, "scale_detailed": True,
-            "incomegroup": True, "region_wb": True
-        },
-        color_continuous_scale=px.colors.sequential.Plasma,
-        range_color=(latest["gini"].min(), latest["gini"].max()),
-        labels={"gini": "Gini (0–100)"},
-        title="Latest Available Gini by Country (WIID curated)"
-    )
-    base_fig.update_layout(coloraxis_colorbar=dict(title="Gini"))
-
-    # Outline overlay
-    submitted_iso = subs["country_iso3"].dropna().str.upper().unique().tolist()
-    if submitted_iso:
-        overlay_df = pd.DataFrame({"c3": submitted_iso, "flag": 1})
-        overlay = go.Choropleth(
-            locations=overlay_df["c3"],
-            z=overlay_df["flag"],
-            locationmode="ISO-3",
-            colorscale=[[0, "rgba(0,0,0,0)"], [1, "rgba(0,0,0,0)"]],
-            showscale=False,
-            marker_line_color="#10e0e0",
-            marker_line_width=2.5,
-            hoverinfo="skip"
-        )
-        base_fig.add_trace(overlay)
 
-    if not clickData:
-        return base_fig, country_facts_card(None), featured_md_block(None), []
+# No point polling for a view the user is not looking at: each interval only
+# runs while its tab is selected (and the page is visible at switch time)
+app.clientside_callback(
+    "function(tab) { return tab !== 'tab-map' || document.hidden; }",
+    Output("interval-refresh", "disabled"),
+    Input("tabs", "value"),
+)
 
-    iso3 = clickData["points"][0]["location"]
-    row = latest.loc[latest["c3"] == iso3].iloc[0].to_dict()
+app.clientside_callback(
+    "function(tab) { return tab !== 'tab-admin' || document.hidden; }",
+    Output("interval-admin-refresh", "disabled"),
+    Input("tabs", "value"),
+)
 
-    sub_iso = subs[subs["country_iso3"] == iso3].copy()
 
-    if not sub_iso.empty:
-        sub_iso["timestamp"] = pd.to_datetime(sub_iso["timestamp"], errors="coerce")
-        recent = sub_iso.sort_values("timestamp", ascending=False).head(12)
-        recent["timestamp"] = recent["timestamp"].dt.strftime("%Y-%m-%d %H:%M")
-        recent_table = recent[
-            ["timestamp", "student_id", "title", "rating", "status"]
-        ].to_dict("records")
-    else:
-        recent_table = []
+# Memoized right-panel children per (country, submissions revision); the
+# revision key makes new submissions bust stale entries. In-process is fine
+# here: the app runs as a single process (python app.py)
+_PANEL_CACHE = {"rev": None, "by_iso": {}}
+
+def _panel_children(iso3):
+    rev = subs_rev()
+    if _PANEL_CACHE["rev"] != rev:
+        _PANEL_CACHE.update(rev=rev, by_iso={})
+    cached = _PANEL_CACHE["by_iso"].get(iso3)
+    if cached is None:
+        facts = FACTS_CACHE.get(iso3, FACTS_PLACEHOLDER)
+        sub_iso = subs_for_iso(iso3)
+        # Raw ndarray compare; the pandas eq path dispatches per-element
+        approved = sub_iso[sub_iso["status"].to_numpy() == "approved"]
+        featured = approved.iloc[0].to_dict() if not approved.empty else None
+        cached = (facts, featured_md_block(featured))
+        _PANEL_CACHE["by_iso"][iso3] = cached
+    return cached
 
-    approved = sub_iso[sub_iso["status"] == "approved"].copy()
-    if not approved.empty:
-        approved["timestamp"] = pd.to_datetime(approved["timestamp"], errors="coerce")
-        featured = approved.sort_values("timestamp",
-                                        ascending=False).iloc[0].to_dict()
-    else:
-        featured = None
+@app.callback(
+    Output("country-facts", "children"),
+    Output("student-note", "children"),
+    Output("selected-iso3", "data"),
+    Output("sub-table", "page_current"),
+    Input("map", "clickData")
+)
+def on_click(clickData):
+    if not clickData:
+        return FACTS_PLACEHOLDER, NO_NOTE_PLACEHOLDER, None, 0
 
-    return base_fig, country_facts_card(row), featured_md_block(featured), recent_table
+    iso3 = clickData["points"][0]["location"]
+    facts, note = _panel_children(iso3)
+    return facts, note, iso3, 0
 
 
+@app.callback(
+    Output("sub-table", "data"),
+    Output("sub-table", "page_count"),
+    Input("sub-table", "page_current"),
+    Input("sub-table", "page_size"),
+    Input("selected-iso3", "data")
+)
+def page_sub_table(page_current, page_size, iso3):
+    # Server-side paging: only the visible slice crosses the wire, so the
+    # payload stays bounded as submissions grow
+    if not iso3:
+        return [], 1
+    sub_iso = subs_for_iso(iso3)
+    start = (page_current or 0) * page_size
+    page = sub_iso.iloc[start:start + page_size].copy()
+    page["timestamp"] = page["timestamp"].dt.strftime("%Y-%m-%d %H:%M")
+    data = page[
+        ["timestamp", "student_id", "title", "rating", "status"]
+    ].to_dict("records")
+    return data, max(1, -(-len(sub_iso) // page_size))
+
+
+# Serialized admin page keyed on (revision, page); tab switches and repeat
+# visits skip the slice/strftime/to_dict work when nothing changed
+_ADMIN_CACHE = {"key": None, "out": None}
+
 @app.callback(
     Output("admin-table", "data"),
+    Output("admin-table", "page_count"),
+    Output("admin-rev", "data"),
     Input("tabs", "value"),
-    Input("interval-admin-refresh", "n_intervals")
+    Input("interval-admin-refresh", "n_intervals"),
+    Input("admin-table", "page_current"),
+    Input("admin-table", "page_size"),
+    State("admin-rev", "data")
 )
-def admin_reload(tab, _):
+def admin_reload(tab, _, page_current, page_size, client_rev):
     if tab != "tab-admin":
-        return no_update
+        return no_update, no_update, no_update
+    # On interval ticks, skip the reload/serialize entirely if this client
+    # already holds the current revision (the store is per-browser, so
+    # other admin viewers still refresh on their own ticks)
+    rev = subs_rev()
+    trigger = callback_context.triggered[0]["prop_id"]
+    if (trigger.startswith("interval-admin-refresh")
+            and client_rev == rev):
+        return no_update, no_update, no_update
+    key = (rev, page_current or 0, page_size)
+    if _ADMIN_CACHE["key"] == key:
+        return _ADMIN_CACHE["out"] + (rev,)
     subs = load_subs()
-    if not subs.empty:
-        subs["timestamp"] = pd.to_datetime(subs["timestamp"], errors="coerce")
-        subs = subs.sort_values("timestamp", ascending=False)
-        subs["timestamp"] = subs["timestamp"].dt.strftime("%Y-%m-%d %H:%M")
-    return subs.to_dict("records")
+    start = (page_current or 0) * page_size
+    page = subs.iloc[start:start + page_size].copy()
+    page["timestamp"] = page["timestamp"].dt.strftime("%Y-%m-%d %H:%M")
+    # Row labels ride along (hidden) so saves can target the right rows
+    page["_row"] = page.index
+    out = (page.to_dict("records"), max(1, -(-len(subs) // page_size)))
+    _ADMIN_CACHE.update(key=key, out=out)
+    return out + (rev,)
 
 
 @app.callback(
@@ -358,8 +670,22 @@ def admin_save(n, rows):
     if rows is None:
         return dbc.Alert("No rows to save.", color="warning")
 
-    df = pd.DataFrame(rows)
-    ok, msg = save_subs(df)
+    page = pd.DataFrame(rows)
+    full = load_subs()
+    if "_row" in page.columns and not full.empty:
+        # Pages are slices, so merge the edited rows back by label instead
+        # of replacing the whole frame with one page
+        page = page.set_index("_row")
+        common = page.index.intersection(full.index)
+        full = full.copy()
+        cols = [c for c in SUB_COLS if c != "timestamp"]
+        full.loc[common, cols] = page.loc[common, cols]
+        full.loc[common, "timestamp"] = pd.to_datetime(
+            page.loc[common, "timestamp"], format="ISO8601",
+            errors="coerce", utc=True)
+        ok, msg = save_subs(full)
+    else:
+        ok, msg = save_subs(page)
     color = "success" if ok else "danger"
     return dbc.Alert(msg, color=color)
 
@@ -392,8 +718,7 @@ def submit(n, student_id, iso3, title, summary, links, rating, status):
     if missing:
         return dbc.Alert(f"Missing: {', '.join(missing)}", color="warning")
 
-    subs = load_subs()
-    now = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     entry = {
         "timestamp": now,
         "student_id": (student_id or "").strip(),
@@ -405,8 +730,7 @@ def submit(n, student_id, iso3, title, summary, links, rating, status):
         "status": (status or "pending").lower()
     }
 
-    subs = pd.concat([subs, pd.DataFrame([entry])], ignore_index=True)
-    ok, msg = save_subs(subs)
+    ok, msg = append_sub(entry)
     color = "success" if ok else "danger"
     return dbc.Alert(msg, color=color)
 